@@ -9,27 +9,32 @@ This MCP server provides system information including:
 
 To run this server:
 1. Save as system_info_server.py
-2. Install dependencies: uv add "mcp[cli]" psutil pytz
+2. Install dependencies: uv add "mcp[cli]" psutil
 3. Run with: uv run mcp dev system_info_server.py
 4. Or install in Claude Desktop: uv run mcp install system_info_server.py
 """
 
+import asyncio
+import os
 import psutil
 import platform
-from datetime import datetime
-from typing import TypedDict
-import pytz
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from functools import wraps
 from pydantic import BaseModel, Field
-import subprocess
-import re
+import socket
 
 from mcp.server.fastmcp import FastMCP
 
-# Create the MCP server
+# Create the MCP server (kept at module level: `mcp dev` and `mcp install` import
+# this file and look up the `mcp` object)
 mcp = FastMCP("System Info Server")
 
 
 # Structured output models
+# Tools build these with model_construct(): the values already come typed from
+# psutil/the OS, so per-call validation is skipped
 class TimeInfo(BaseModel):
     """Current time information"""
     current_time_ist: str = Field(description="Current time in IST format")
@@ -72,7 +77,7 @@ class SystemInfo(BaseModel):
     platform_info: dict[str, str] = Field(description="Platform and OS information")
     
 class NetstatPortInfo(BaseModel):
-    """Information extracted from netstat for a given port"""
+    """Information about the socket bound to a given port"""
     port: int
     pid: int | None
     protocol: str | None
@@ -82,98 +87,234 @@ class NetstatPortInfo(BaseModel):
     raw_line: str
 
 
+_INV_GB = 1.0 / (1 << 30)
+
+
 def bytes_to_gb(bytes_value: int) -> float:
     """Convert bytes to gigabytes with 2 decimal precision"""
-    return round(bytes_value / (1024**3), 2)
+    return round(bytes_value * _INV_GB, 2)
+
+
+_ttl_results: dict[str, tuple[float, asyncio.Future]] = {}
+
+
+def _ttl_cache(seconds: float):
+    """Reuse a coroutine function's last result for `seconds` to coalesce bursts of calls"""
+    def decorator(func):
+        def forget_failure(task):
+            # Don't serve a failed or cancelled call from the cache
+            if task.cancelled() or task.exception() is not None:
+                if _ttl_results.get(func.__name__, (None, None))[1] is task:
+                    del _ttl_results[func.__name__]
 
+        @wraps(func)
+        async def wrapper():
+            # Cache the task rather than its result so callers arriving
+            # while a read is in flight share it instead of starting another
+            now = time.monotonic()
+            cached = _ttl_results.get(func.__name__)
+            if cached is None or now - cached[0] >= seconds:
+                task = asyncio.ensure_future(func())
+                task.add_done_callback(forget_failure)
+                cached = (now, task)
+                _ttl_results[func.__name__] = cached
+            # Shield so one cancelled caller doesn't cancel the shared read
+            return await asyncio.shield(cached[1])
+        return wrapper
+    return decorator
 
 
+_IS_LINUX = sys.platform.startswith("linux")
+_MEMINFO_KEYS = (b"MemTotal", b"MemFree", b"MemAvailable")
+
+
+def _read_linux_meminfo() -> tuple[int, int, int] | None:
+    """Read (total, available, free) in bytes straight from /proc/meminfo"""
+    fields = {}
+    try:
+        with open("/proc/meminfo", "rb") as f:
+            for line in f:
+                key, _, rest = line.partition(b":")
+                if key in _MEMINFO_KEYS:
+                    fields[key] = int(rest.split()[0]) * 1024  # values are in kB
+                    if len(fields) == len(_MEMINFO_KEYS):
+                        break
+    except OSError:
+        return None
+    if len(fields) != len(_MEMINFO_KEYS):
+        # MemAvailable is missing on very old kernels, let psutil estimate it
+        return None
+    total, available = fields[b"MemTotal"], fields[b"MemAvailable"]
+    if available == 0 or available > total:
+        # Bogus values psutil corrects for (0 on some kernels, > total in
+        # LXC containers), so leave those to psutil.virtual_memory()
+        return None
+    return total, available, fields[b"MemFree"]
+
+
+def _read_cpuinfo_field(name: str) -> str | None:
+    """Return the first value of `name` in /proc/cpuinfo, or None if absent"""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith(name):
+                    return line.partition(":")[2].strip()
+    except OSError:
+        pass
+    return None
+
+
+def _cpu_freq_mhz() -> float:
+    """Current CPU frequency, from one /proc/cpuinfo line on Linux"""
+    if _IS_LINUX:
+        mhz = _read_cpuinfo_field("cpu MHz")
+        if mhz:
+            return float(mhz)
+    # psutil opens one sysfs file per CPU on Linux, so it is only the fallback
+    cpu_freq = psutil.cpu_freq()
+    return cpu_freq.current if cpu_freq else 0.0
+
+
+# Facts that don't change after boot, queried once at import
+# IST is a fixed UTC+05:30 offset with no DST, so no tz database is needed
+_IST_TZ = timezone(timedelta(hours=5, minutes=30), "IST")
+# cpu_count() returns None when undetermined; the schema requires an int
+_CPU_COUNT = psutil.cpu_count() or 0
+_HAS_LOADAVG = hasattr(os, "getloadavg")
+_ZERO_LOAD = (0.0, 0.0, 0.0)
+_TOTAL_MEM = psutil.virtual_memory().total
+_BOOT_TIME = psutil.boot_time()
+# platform.processor() is usually empty on Linux, the model name is more useful
+_PROCESSOR = (_read_cpuinfo_field("model name") if _IS_LINUX else None) or platform.processor()
+_PLATFORM = {
+    "system": platform.system(),
+    "platform": platform.platform(),
+    "machine": platform.machine(),
+    "processor": _PROCESSOR,
+    "python_version": platform.python_version(),
+    "hostname": platform.node()
+}
+_PLATFORM_TEXT = "\n".join(
+    f"{label}: {_PLATFORM[key]}"
+    for label, key in [
+        ("System", "system"),
+        ("Platform", "platform"),
+        ("Machine", "machine"),
+        ("Processor", "processor"),
+        ("Python Version", "python_version"),
+        ("Hostname", "hostname"),
+    ]
+)
+
 
 @mcp.tool()
 def get_current_time() -> TimeInfo:
     """Get the current time in IST (India Standard Time) and UTC"""
-    # Get current time
-    utc_now = datetime.now(pytz.UTC)
-    ist_tz = pytz.timezone('Asia/Kolkata')
-    ist_now = utc_now.astimezone(ist_tz)
+    # Read the clock once and derive both representations from it
+    timestamp = time.time()
+    utc_now = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    ist_now = utc_now.astimezone(_IST_TZ)
     
-    return TimeInfo(
+    return TimeInfo.model_construct(
         current_time_ist=ist_now.strftime("%Y-%m-%d %H:%M:%S %Z"),
         current_time_utc=utc_now.strftime("%Y-%m-%d %H:%M:%S %Z"),
         timezone="Asia/Kolkata (IST)",
-        timestamp=utc_now.timestamp()
+        timestamp=timestamp
     )
 
 
 @mcp.tool()
-def get_memory_usage() -> MemoryInfo:
+@_ttl_cache(1.0)
+async def get_memory_usage() -> MemoryInfo:
     """Get current system memory usage statistics"""
-    memory = psutil.virtual_memory()
+    # Blocking reads run in a worker thread so the event loop stays free
+    meminfo = await asyncio.to_thread(_read_linux_meminfo) if _IS_LINUX else None
+    if meminfo is not None:
+        # Same used/percent definitions psutil uses once MemAvailable is sane
+        total, available, free = meminfo
+        used = total - available
+        percent = used / total * 100
+    else:
+        memory = await asyncio.to_thread(psutil.virtual_memory)
+        available, used, free, percent = memory.available, memory.used, memory.free, memory.percent
     
-    return MemoryInfo(
-        total_gb=bytes_to_gb(memory.total),
-        available_gb=bytes_to_gb(memory.available),
-        used_gb=bytes_to_gb(memory.used),
-        percentage_used=round(memory.percent, 1),
-        free_gb=bytes_to_gb(memory.free)
+    return MemoryInfo.model_construct(
+        total_gb=bytes_to_gb(_TOTAL_MEM),
+        available_gb=bytes_to_gb(available),
+        used_gb=bytes_to_gb(used),
+        percentage_used=round(percent, 1),
+        free_gb=bytes_to_gb(free)
     )
 
 
 @mcp.tool()
-def get_cpu_usage() -> CPUInfo:
+@_ttl_cache(1.0)
+async def get_cpu_usage() -> CPUInfo:
     """Get current CPU usage and information"""
-    # Get CPU percentage (1 second interval for accuracy)
-    cpu_percent = psutil.cpu_percent(interval=1)
-    cpu_count = psutil.cpu_count()
+    # Get CPU percentage since the previous call (non-blocking). psutil keeps
+    # this baseline per thread, so read it on the event loop thread every time
+    cpu_percent = psutil.cpu_percent(interval=None)
     
     # Get CPU frequency
-    cpu_freq = psutil.cpu_freq()
-    current_freq = cpu_freq.current if cpu_freq else 0.0
+    current_freq = await asyncio.to_thread(_cpu_freq_mhz)
     
-    # Get load average (Unix-like systems only)
-    try:
-        load_avg = list(psutil.getloadavg())
-    except (AttributeError, OSError):
-        # Windows doesn't have load average
-        load_avg = [0.0, 0.0, 0.0]
+    # Get load average (Unix-like systems only, Windows doesn't have one)
+    load_avg = _ZERO_LOAD
+    if _HAS_LOADAVG:
+        try:
+            load_avg = os.getloadavg()
+        except OSError:
+            # Raised when the load average can't be obtained
+            pass
     
-    return CPUInfo(
+    return CPUInfo.model_construct(
         cpu_percent=round(cpu_percent, 1),
-        cpu_count=cpu_count,
+        cpu_count=_CPU_COUNT,
         cpu_freq_current=round(current_freq, 1),
         load_average=[round(x, 2) for x in load_avg]
     )
 
 
 @mcp.tool()
-def get_disk_usage() -> DiskInfo:
+@_ttl_cache(30.0)
+async def get_disk_usage() -> DiskInfo:
     """Get disk usage for the root partition"""
-    disk_usage = psutil.disk_usage('/')
+    if hasattr(os, "statvfs"):
+        # Single syscall, same arithmetic as psutil.disk_usage on POSIX
+        st = await asyncio.to_thread(os.statvfs, '/')
+        total = st.f_blocks * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        free = st.f_bavail * st.f_frsize
+    else:
+        disk_usage = await asyncio.to_thread(psutil.disk_usage, '/')
+        total, used, free = disk_usage.total, disk_usage.used, disk_usage.free
     
-    return DiskInfo(
-        total_gb=bytes_to_gb(disk_usage.total),
-        used_gb=bytes_to_gb(disk_usage.used),
-        free_gb=bytes_to_gb(disk_usage.free),
-        percentage_used=round((disk_usage.used / disk_usage.total) * 100, 1)
+    return DiskInfo.model_construct(
+        total_gb=bytes_to_gb(total),
+        used_gb=bytes_to_gb(used),
+        free_gb=bytes_to_gb(free),
+        percentage_used=round((used / total) * 100, 1)
     )
 
 
 @mcp.tool()
-def get_system_info() -> SystemInfo:
+@_ttl_cache(1.0)
+async def get_system_info() -> SystemInfo:
     """Get comprehensive system information including time, memory, CPU, and disk usage"""
-    return SystemInfo(
+    # Gather the parts concurrently so this takes as long as the slowest one
+    memory_info, cpu_info, disk_info = await asyncio.gather(
+        get_memory_usage(),
+        get_cpu_usage(),
+        get_disk_usage()
+    )
+    
+    return SystemInfo.model_construct(
         time_info=get_current_time(),
-        memory_info=get_memory_usage(),
-        cpu_info=get_cpu_usage(),
-        disk_info=get_disk_usage(),
-        platform_info={
-            "system": platform.system(),
-            "platform": platform.platform(),
-            "machine": platform.machine(),
-            "processor": platform.processor(),
-            "python_version": platform.python_version(),
-            "hostname": platform.node()
-        }
+        memory_info=memory_info,
+        cpu_info=cpu_info,
+        disk_info=disk_info,
+        # model_construct doesn't copy, so don't hand out the module-level dict
+        platform_info=dict(_PLATFORM)
     )
 
 
@@ -181,62 +322,82 @@ def get_system_info() -> SystemInfo:
 @mcp.resource("system://platform")
 def get_platform_info() -> str:
     """Get platform and system information"""
-    info = {
-        "System": platform.system(),
-        "Platform": platform.platform(),
-        "Machine": platform.machine(),
-        "Processor": platform.processor(),
-        "Python Version": platform.python_version(),
-        "Hostname": platform.node()
-    }
-    
-    return "\n".join(f"{key}: {value}" for key, value in info.items())
+    return _PLATFORM_TEXT
+
+
+
+
+
 
+def _format_address(addr) -> str:
+    """Format a psutil (ip, port) address, bracketing IPv6 hosts like netstat"""
+    if ":" in addr.ip:
+        return f"[{addr.ip}]:{addr.port}"
+    return f"{addr.ip}:{addr.port}"
 
 
+def _find_port_per_process(port: int) -> tuple[int | None, object | None, bool]:
+    """Fallback lookup that walks each process we're allowed to inspect
 
+    Returns (pid, connection, denied); `denied` is True if any process had to
+    be skipped, in which case a miss doesn't mean the port is free.
+    """
+    denied = False
+    for proc in psutil.process_iter():
+        try:
+            for conn in proc.net_connections(kind="inet"):
+                if conn.laddr and conn.laddr.port == port:
+                    return proc.pid, conn, denied
+        except psutil.AccessDenied:
+            denied = True
+        except psutil.NoSuchProcess:
+            continue
+    return None, None, denied
 
 
 @mcp.tool()
-def get_port_info_netstat(port: int) -> NetstatPortInfo:
-    """Use netstat -ano to find the process using a given port on Windows"""
+async def get_port_info_netstat(port: int) -> NetstatPortInfo:
+    """Find the process using a given local port"""
     try:
-        # Run netstat command
-        result = subprocess.run(["netstat", "-ano"], capture_output=True, text=True, shell=True)
-        output = result.stdout
-
-        # Match lines with the port
-        for line in output.splitlines():
-            if f":{port} " in line:  # Ensure space after port to avoid partial matches
-                parts = re.split(r"\s+", line.strip())
-                if len(parts) >= 5:
-                    proto = parts[0]
-                    local_address = parts[1]
-                    foreign_address = parts[2]
-                    state = parts[3] if proto.lower() == "tcp" else ""
-                    pid = int(parts[-1])
-                    return NetstatPortInfo(
-                        port=port,
-                        pid=pid,
-                        protocol=proto,
-                        local_address=local_address,
-                        foreign_address=foreign_address,
-                        state=state,
-                        raw_line=line.strip()
-                    )
-
-        return NetstatPortInfo(
+        pid, match, denied = None, None, False
+        try:
+            # Read the kernel's socket tables directly, no subprocess needed.
+            # On Windows psutil gets these from the IP Helper API
+            # (GetExtendedTcpTable/GetExtendedUdpTable) with owning PIDs.
+            for conn in await asyncio.to_thread(psutil.net_connections, "inet"):
+                if conn.laddr and conn.laddr.port == port:
+                    pid, match = conn.pid, conn
+                    break
+        except psutil.AccessDenied:
+            # macOS needs root for the system-wide table, but a process's
+            # own sockets can still be listed
+            pid, match, denied = await asyncio.to_thread(_find_port_per_process, port)
+
+        if match is not None:
+            is_tcp = match.type == socket.SOCK_STREAM
+            return NetstatPortInfo.model_construct(
+                port=port,
+                pid=pid,
+                protocol="TCP" if is_tcp else "UDP",
+                local_address=_format_address(match.laddr),
+                foreign_address=_format_address(match.raddr) if match.raddr else "",
+                state=match.status if is_tcp else "",
+                raw_line=""
+            )
+
+        return NetstatPortInfo.model_construct(
             port=port,
             pid=None,
             protocol=None,
             local_address=None,
             foreign_address=None,
             state=None,
-            raw_line="Not found"
+            raw_line="Not found (some processes could not be inspected without elevated privileges)"
+            if denied else "Not found"
         )
 
     except Exception as e:
-        return NetstatPortInfo(
+        return NetstatPortInfo.model_construct(
             port=port,
             pid=None,
             protocol=None,
@@ -251,12 +412,11 @@ def get_port_info_netstat(port: int) -> NetstatPortInfo:
 def get_system_uptime() -> str:
     """Get system uptime"""
     try:
-        boot_time = psutil.boot_time()
-        uptime_seconds = datetime.now().timestamp() - boot_time
+        uptime_seconds = time.time() - _BOOT_TIME
         
-        days = int(uptime_seconds // 86400)
-        hours = int((uptime_seconds % 86400) // 3600)
-        minutes = int((uptime_seconds % 3600) // 60)
+        days, remainder = divmod(int(uptime_seconds), 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes = remainder // 60
         
         return f"System uptime: {days} days, {hours} hours, {minutes} minutes"
     except Exception as e: